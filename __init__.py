@@ -4,3 +4,5 @@ from ymd_utility.ymd_utility import YMDDate
 # Verfication Functions
 from ymd_utility.ymd_utility import is_ymd, is_ymd_date, is_ymd_datetime
 
+# Batch Functions
+from ymd_utility.ymd_utility import is_us_federal_holiday_batch, is_weekend_batch, next_business_day_batch
@@ -2,9 +2,13 @@ from datetime import datetime as dt
 from datetime import date as date_object
 from datetime import timedelta
 
-from pandas.tseries.holiday import USFederalHolidayCalendar
+from functools import lru_cache, total_ordering
 
-from re import compile, IGNORECASE
+from typing import TYPE_CHECKING
+
+# numpy is imported lazily by the batch functions; this only serves the annotations
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def is_ymd(ymd_date: str) -> bool:
@@ -16,17 +20,29 @@ def is_ymd(ymd_date: str) -> bool:
     -----------
     - ymd_date: str = Input string representing a date.
     """
-    # Check regex pattern for YYYY-MM-DD format
-    date_pattern = compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}", IGNORECASE)
-    if not date_pattern.match(ymd_date):
-        return False
+    return _parse_ymd(ymd_date) is not None
+
+def _parse_ymd(ymd_date: str) -> date_object | None:
+    """
+    !!!INTERNAL FUNCTION!!!
+    Parses a string in YYYY-MM-DD format. Returns the matching datetime.date object,
+    or None if the string is not in YYYY-MM-DD format or not a valid date.
+
+    Parameters:
+    -----------
+    - ymd_date: str = Input string representing a date.
+    """
+    # Check the fixed-width YYYY-MM-DD shape before handing off to the parser
+    if not (isinstance(ymd_date, str) and len(ymd_date) == 10 and ymd_date[4] == "-" and ymd_date[7] == "-"):
+        return None
     
-    year, month, day = ymd_date.split("-")
+    # fromisoformat validates the digits and the calendar date in one C call. This is
+    # faster for valid input than slicing with str.isdigit() and calling date(), which
+    # only wins on malformed strings.
     try:
-        date_object(int(year), int(month), int(day))
-        return True
+        return date_object.fromisoformat(ymd_date)
     except ValueError:
-        return False
+        return None
 
 def is_ymd_date(ymd_date: date_object) -> bool:
     """
@@ -57,8 +73,140 @@ def is_ymd_datetime(ymd_datetime: dt) -> bool:
     # Wrap is_ymd function
     return is_ymd(ymd_str)
 
+@lru_cache(maxsize=256)
+def _federal_holidays_for_year(year: int) -> frozenset:
+    """
+    !!!INTERNAL FUNCTION!!!
+    Returns the US Federal Holidays of the given year as a frozenset of datetime.date
+    objects. Results are cached per year, so the pandas calendar is only built once
+    for each year that is queried.
+
+    Parameters:
+    -----------
+    - year: int = The calendar year to retrieve holidays for.
+    """
+    # Imported on first use so pandas is only loaded when holidays are needed
+    from pandas.tseries.holiday import USFederalHolidayCalendar
+
+    cal = USFederalHolidayCalendar()
+    holidays_datetime = cal.holidays(start=f"{year:04d}-01-01", end=f"{year:04d}-12-31").to_pydatetime()
+    return frozenset(h.date() for h in holidays_datetime)
+
+def _weekday_zeller(year, month, day):
+    """
+    !!!INTERNAL FUNCTION!!!
+    Computes the day of the week with Zeller's congruence using integer arithmetic only.
+    Returns 0 (Monday) through 6 (Sunday), matching datetime.date.weekday(). Works on
+    plain ints as well as numpy integer arrays of matching shape.
+
+    Parameters:
+    -----------
+    - year: int = Calendar year.
+    - month: int = Month, 1 through 12.
+    - day: int = Day of the month.
+    """
+    # January and February count as months 13 and 14 of the previous year
+    shift = (month < 3) * 1
+    month = month + 12 * shift
+    year = year - shift
+    k = year % 100
+    j = year // 100
+    h = (day + (13 * (month + 1)) // 5 + k + k // 4 + j // 4 + 5 * j) % 7
+    # Zeller counts from Saturday; rotate so Monday is 0
+    return (h + 5) % 7
+
+def _federal_holidays_array(years) -> "np.ndarray":
+    """
+    !!!INTERNAL FUNCTION!!!
+    Returns the US Federal Holidays of the given years as a sorted numpy array with
+    dtype datetime64[D], built from the per-year cached holiday sets.
+
+    Parameters:
+    -----------
+    - years: iterable of int calendar years.
+    """
+    import numpy as np
 
+    holidays = sorted(h for year in years for h in _federal_holidays_for_year(int(year)))
+    return np.array(holidays, dtype="datetime64[D]")
+
+def is_us_federal_holiday_batch(dates) -> "np.ndarray":
+    """
+    Checks many dates at once for US Federal Holidays. Returns a numpy array of bools
+    with the same shape as the input. NaT entries are reported as False.
+
+    Parameters:
+    -----------
+    - dates: array-like of numpy datetime64 values, datetime.date objects, or strings
+        in YYYY-MM-DD format.
+    """
+    import numpy as np
+
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    # NaT has no year; np.isin reports it as False without holidays for it
+    valid_dates = dates[~np.isnat(dates)]
+    years = np.unique(valid_dates.astype("datetime64[Y]").astype(int) + 1970)
+    return np.isin(dates, _federal_holidays_array(years))
+
+def is_weekend_batch(dates) -> "np.ndarray":
+    """
+    Checks many dates at once for Saturdays and Sundays. Returns a numpy array of bools
+    with the same shape as the input. NaT entries are reported as False.
+
+    Parameters:
+    -----------
+    - dates: array-like of numpy datetime64 values, datetime.date objects, or strings
+        in YYYY-MM-DD format.
+    """
+    import numpy as np
+
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    months = dates.astype("datetime64[M]")
+    years = dates.astype("datetime64[Y]").astype(int) + 1970
+    month_numbers = months.astype(int) % 12 + 1
+    days = (dates - months).astype(int) + 1
+    # NaT has no weekday; the formula would otherwise run on its sentinel integer
+    return (_weekday_zeller(years, month_numbers, days) >= 5) & ~np.isnat(dates)
+
+def next_business_day_batch(dates) -> "np.ndarray":
+    """
+    Retrieves the next business day for many dates at once, accounting for weekends and
+    US Federal Holidays. Equivalent to YMDDate.next_business_day() for each element.
+    Returns a numpy array with dtype datetime64[D]. NaT entries are returned as NaT.
+
+    Parameters:
+    -----------
+    - dates: array-like of numpy datetime64 values, datetime.date objects, or strings
+        in YYYY-MM-DD format.
+    """
+    import numpy as np
+
+    # Start from the following day and roll forward onto the first business day
+    next_days = np.asarray(dates, dtype="datetime64[D]") + 1
+    # Include the following year so holidays just past New Year are covered.
+    # NaT has no year; np.busday_offset passes it through as NaT
+    valid_days = next_days[~np.isnat(next_days)]
+    years = np.unique(valid_days.astype("datetime64[Y]").astype(int) + 1970)
+    holidays = _federal_holidays_array(np.union1d(years, years + 1))
+    return np.busday_offset(next_days, 0, roll="forward", holidays=holidays)
+
+
+@total_ordering
 class YMDDate:
+    _DAYS_OF_THE_WEEK = (
+        "Monday",
+        "Tuesday",
+        "Wednesday",
+        "Thursday",
+        "Friday",
+        "Saturday",
+        "Sunday"
+    )
+    _ABBREV_DEFAULT = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+    # No per-instance __dict__; the parsed fields are the only instance state
+    __slots__ = ("_y", "_m", "_d", "_date", "_str", "_is_fed_holiday")
+
     def __init__(self, date: str | date_object | dt):
         """
         YMDDate takes in a date as a string object, Date object, or Datetime object.
@@ -78,69 +226,61 @@ class YMDDate:
         date: datetime.datetime = A datetime.datetime object. For verification checks, 
             use the provided is_ymd_datetime() function.
         """
-        self._year: str = None
-        self._month: str = None
-        self._day: str = None
-
-        self._DAYS_OF_THE_WEEK = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday"
-        ]
-
-        # User-defined holidays
-        self._holidays: list = []
-
-        if type(date) == str:
-            if is_ymd(date):
-                self._year, self._month, self._day = self._ymd_from_string(date)
-            else:
+        # Computed on first call to is_us_federal_holiday()
+        self._is_fed_holiday: bool = None
+
+        # Exact type checks; dt is a subclass of date_object, so isinstance would be ambiguous
+        date_type = type(date)
+        if date_type is str:
+            parsed = _parse_ymd(date)
+            if parsed is None:
                 raise ValueError(f"String {date} is not in YYYY-MM-DD format or not a valid date.")
-        elif type(date) == date_object:
-            if is_ymd_date(date):
-                self._year, self._month, self._day = self._ymd_from_date(date)
-            else:
-                raise ValueError(f"Date object {str(date)} is not valid.")
-        elif type(date) == dt:
-            if is_ymd_datetime(date):
-                self._year, self._month, self._day = self._ymd_from_datetime(date)
-            else:
-                raise ValueError(f"Datetime object {str(date)} is not valid.")
+        elif date_type is dt:
+            parsed = date.date()
+        elif date_type is date_object:
+            parsed = date
         else:
             raise ValueError(f"YMDDate accepts a Date object, Datetime object, or string value. Got {type(date)}")
         
+        # Parse once; comparisons and conversions work off the cached ints and date
+        self._date = parsed
+        self._y, self._m, self._d = parsed.year, parsed.month, parsed.day
+        self._str = parsed.isoformat()
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def from_string(cls, ymd_string: str) -> "YMDDate":
+        """
+        Creates a YMDDate from a string in YYYY-MM-DD format. Results are cached, so
+        repeated calls with the same string return the same instance. This is safe
+        because YMDDate objects are immutable.
+
+        Parameters:
+        -----------
+        - ymd_string: str = A string in YMD format. Raises ValueError if it is invalid.
+        """
+        return cls(ymd_string)
     
     @property
     def year(self):
-        return self._year
+        return self._str[0:4]
     
     @property
     def month(self):
-        return self._month
+        return self._str[5:7]
     
     @property
     def day(self):
-        return self._day
+        return self._str[8:10]
     
     def is_us_federal_holiday(self):
         """
         Checks whether the YMDDate represents a US federal holiday.
         """
-        # Determine whether the date given is a holiday
-        start_date = f"{self._year}-01-01"
-        end_date = f"{self._year}-12-31"
-        cal = USFederalHolidayCalendar()
-        holidays_datetime = cal.holidays(start=start_date, end=end_date).to_pydatetime()
-        holidays = [h.date() for h in holidays_datetime]
-        
-        if self.to_date() in holidays:
-            return True
-        
-        return False
+        # The answer never changes for an immutable date, so compute it once per instance
+        if self._is_fed_holiday is None:
+            self._is_fed_holiday = self._date in _federal_holidays_for_year(self._y)
+        return self._is_fed_holiday
     
     def is_holiday(self, holidays:list):
         """
@@ -148,44 +288,47 @@ class YMDDate:
 
         Parameters:
         -----------
-        - holidays: list of YMDDate objects (or strings in format "YYYY-MM-DD") to check against.
+        - holidays: list of YMDDate objects (or strings in format "YYYY-MM-DD", date or
+            datetime objects) to check against. Raises ValueError on an entry that is not
+            a valid date.
         """
-        if len(holidays) == 0:
-            return False
-        
+        target = self._date
         for holiday in holidays:
-            # For strings, convert into YMDDate object and compare to self
-            if type(holiday) == str:
-                try:
-                    ymd_holiday = YMDDate(holiday)
-                except ValueError as ve:
-                    print(ve.args[0])
-                    return None
-                
-                if ymd_holiday == self:
-                    return True
-                
-            # For YMDDate objects, compare to self
-            elif type(holiday) == self.__class__:
-                if holiday == self:
-                    return True
+            # Compare plain dates; no intermediate YMDDate objects are constructed
+            holiday_date = self._coerce_to_date(holiday)
+            if holiday_date is None:
+                raise ValueError(f"Invalid holiday entry: {holiday!r}")
+            
+            if holiday_date == target:
+                return True
             
         return False
     
+    def is_holiday_set(self, holiday_set: frozenset) -> bool:
+        """
+        Checks whether the YMDDate is in the given set of holidays. Prefer this over
+        is_holiday() when checking many dates against the same holidays, since the
+        lookup does not scan the collection.
+
+        Parameters:
+        -----------
+        - holiday_set: set or frozenset of YMDDate or datetime.date objects to check against.
+            Strings and datetime objects hash differently from the matching date and are
+            never found, so convert them first (e.g. with YMDDate(...)).
+        """
+        return self._date in holiday_set
+    
     def is_today(self):
         """
         Checks whether the YMDDate represents today's date.
         """
-        today = dt.today()
-        if (int(self._year) == today.year) and (int(self._month) == today.month) and (int(self._day) == today.day):
-            return True
-        return False
+        return self._date == date_object.today()
     
     def is_weekend(self):
         """
         Checks whether the YMDDate represents a Saturday or Sunday.
         """
-        if dt.weekday(self.to_date()) >= 5:
+        if self._date.weekday() >= 5:
             return True
         return False
     
@@ -193,11 +336,11 @@ class YMDDate:
         """
         Checks whether the YMDDate represents a week day (Monday - Friday)
         """
-        if dt.weekday(self.to_date()) < 5:
+        if self._date.weekday() < 5:
             return True
         return False
     
-    def get_weekday(self, name: bool = True, abbreviated: bool = False, abbreviations:list=['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']):
+    def get_weekday(self, name: bool = True, abbreviated: bool = False, abbreviations:list=None):
         """
         Returns the weekday (Monday, Tuesday, etc.) that YMDDate falls on.
 
@@ -209,20 +352,24 @@ class YMDDate:
         - abbreviated: bool = If True, then names are abbreviated as described in abbreviations parameter:
             'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'
         - abbreviations: list = The abbreviations used when abbreviated is True. Length must be 7.
+            Defaults to 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun' when None.
         """
         if name is None:
             raise ValueError("get_weekday parameter 'name' cannot be None.")
         
+        if abbreviations is None:
+            abbreviations = self._ABBREV_DEFAULT
+        
         if len(abbreviations) != 7:
             raise ValueError("Length of abbreviations list must be 7.")
         
         # Returns the number associated with the day of the week
         if name == False:
-            return dt.weekday(self.to_date())
+            return self._date.weekday()
         # Returns the weekday name associated with the day number
         elif name == True:
             # Obtain day number from datetime module
-            day_number = dt.weekday(self.to_date())
+            day_number = self._date.weekday()
             # Abbreviate if necessary
             if abbreviated:
                 return abbreviations[day_number]
@@ -244,12 +391,8 @@ class YMDDate:
         if days is None:
             raise ValueError("n_days parameter 'days' cannot be None.")
         
-        if days > 0:
-            return YMDDate(self.to_datetime() + timedelta(days = days))
-        elif days < 0:
-            return YMDDate(self.to_datetime() - timedelta(days = abs(days)))
-        
-        return YMDDate(self.to_datetime())
+        # timedelta is signed, so negative values go backwards without branching
+        return YMDDate(self._date + timedelta(days = days))
     
     def n_weeks(self, weeks:int):
         """
@@ -264,12 +407,7 @@ class YMDDate:
         if weeks is None:
             raise ValueError("n_weeks parameter 'weeks' cannot be None.")
         
-        if weeks > 0:
-            return YMDDate(self.to_datetime() + timedelta(weeks = weeks))
-        elif weeks < 0:
-            return YMDDate(self.to_datetime() - timedelta(weeks = abs(weeks)))
-        
-        return YMDDate(self.to_datetime())
+        return YMDDate(self._date + timedelta(weeks = weeks))
     
     def n_months(self, months: int, units:str = "W", weeks_per_month: int = 4, days_per_month: int = 30):
         """
@@ -287,27 +425,17 @@ class YMDDate:
         - days_per_month: an integer specifying the number of days to consider as 1 month. 
         """
         if months is None:
-            raise ValueError("n_days parameter 'months' cannot be None.")
-        
-        if months == 0:
-            return YMDDate(self.to_datetime())
-        
-        if units.upper() == 'W':
-            number_of_weeks = abs(weeks_per_month * months)
-            if months > 0:
-                return YMDDate(self.to_datetime() + timedelta(weeks = number_of_weeks))
-            elif months < 0:
-                return YMDDate(self.to_datetime() - timedelta(weeks = number_of_weeks))
-            
-        elif units.upper() == 'D':
-            number_of_days = abs(days_per_month * months)
-            if months > 0:
-                return YMDDate(self.to_datetime() + timedelta(days = number_of_days))
-            elif months < 0:
-                return YMDDate(self.to_datetime() - timedelta(days = number_of_days))
+            raise ValueError("n_months parameter 'months' cannot be None.")
         
+        units = units.upper()
+        if units == 'W':
+            delta = timedelta(weeks = weeks_per_month * months)
+        elif units == 'D':
+            delta = timedelta(days = days_per_month * months)
         else:
             raise ValueError("Units parameter must be either 'W' or 'D'.")
+        
+        return YMDDate(self._date + delta)
 
     
     def n_years(self, years: int, units: str = "W", days_per_year: int = 365, weeks_per_year: int = 52):
@@ -328,24 +456,15 @@ class YMDDate:
         if years is None:
             raise ValueError("n_years parameter 'years' cannot be None.")
         
-        if years == 0:
-            return YMDDate(self.to_datetime())
-
+        units = units.upper()
         if units == 'D':
-            number_of_days = abs(years * days_per_year)
-            if years > 0:
-                return YMDDate(self.to_datetime() + timedelta(days = number_of_days))
-            elif years < 0:
-                return YMDDate(self.to_datetime() - timedelta(days = number_of_days))
+            delta = timedelta(days = days_per_year * years)
         elif units == 'W':
-            number_of_weeks = abs(years * weeks_per_year)
-            if years > 0:
-                return YMDDate(self.to_datetime() + timedelta(weeks = number_of_weeks))
-            elif years < 0:
-                return YMDDate(self.to_datetime() - timedelta(weeks = number_of_weeks))
-        
+            delta = timedelta(weeks = weeks_per_year * years)
         else:
             raise ValueError("Units parameter must be either 'W' or 'D'.")
+        
+        return YMDDate(self._date + delta)
     
     def next_business_day(self):
         """
@@ -353,18 +472,20 @@ class YMDDate:
 
         Returns a YMDDate instance.
         """
-        next_day = self.tomorrow()
+        # Step over plain dates against the cached holiday sets; only the result is wrapped
+        one_day = timedelta(days = 1)
+        next_day = self._date + one_day
 
-        while next_day.is_us_federal_holiday() or next_day.is_weekend():
-            next_day = next_day.tomorrow()
+        while next_day.weekday() >= 5 or next_day in _federal_holidays_for_year(next_day.year):
+            next_day += one_day
         
-        return next_day
+        return YMDDate(next_day)
     
     def next_week(self):
         """
         Retrieves the date exactly one week from YMDDate. Returns as a YMDDate object.
         """
-        next_week:dt = self.to_datetime() + timedelta(days = 7)
+        next_week:date_object = self._date + timedelta(days = 7)
         return YMDDate(next_week)
     
     def next_month(self, full_date=True):
@@ -377,7 +498,7 @@ class YMDDate:
         if full_date:
             return self.n_months(1)
         
-        return int(self.n_months(1).month)
+        return self.n_months(1)._m
     
     def next_year(self, full_date=True):
         """
@@ -389,128 +510,78 @@ class YMDDate:
         if full_date:
             return self.n_years(1)
         
-        return int(self.year) + 1
+        return self._y + 1
     
     def tomorrow(self):
         """
         Returns tomorrows date as a YMDDate object.
         """
-        next_day:dt = self.to_datetime() + timedelta(days = 1)
+        next_day:date_object = self._date + timedelta(days = 1)
         return YMDDate(next_day)
     
     def to_date(self) -> date_object:
         """
         Converts YMDDate object to date object.
         """
-        return date_object(int(self._year), int(self._month), int(self._day))
+        return self._date
     
     def to_datetime(self) -> dt:
         """
         Converts YMDDate object to datetime object.
         """
-        return dt(year=int(self._year), month=int(self._month), day=int(self._day))
+        return dt(year=self._y, month=self._m, day=self._d)
     
     def __eq__(self, other) -> bool:
-        if isinstance(other, self.__class__):
-            if (self._year == other.year) and (self._month == other.month) and (self._day == other.day):
-                return True
-            return False
-        elif isinstance(other, str):
-            if is_ymd(other):
-                y, m, d = self._ymd_from_string(other)
-                if (self._year == y) and (self._month == m) and (self._day == d):
-                    return True
-            return False
-        elif isinstance(other, dt):
-            if is_ymd_datetime(other):
-                (y, m, d) = self._ymd_from_datetime(other) # strings
-                if (self._year == y) and (self._month == m) and (self._day == d):
-                    return True
-            return False
-        elif isinstance(other, date_object):
-            if is_ymd_date(other):
-                (y, m, d) = self._ymd_from_date(other) # strings
-                if (self._year == y) and (self._month == m) and (self._day == d):
-                    return True
-            return False
-        else:
-            return False
-        
-    def __gt__(self, other) -> bool:
-        # Calculate this objects date representation
-        this_date = date_object(int(self._year), int(self._month), int(self._day))
-
-        # Compare all supported instances
-        if isinstance(other, self.__class__):
-            other_date = date_object(int(other._year), int(other._month), int(other._day))
-            return this_date > other_date
-        
-        elif isinstance(other, str):
-            if is_ymd(other):
-                y, m, d = self._ymd_from_string(other)
-                other_date = date_object(int(y), int(m), int(d))
-                
-                return this_date > other_date
-            return False
-        
-        elif isinstance(other, dt):
-            if is_ymd_datetime(other):
-                (y, m, d) = self._ymd_from_datetime(other) # strings
-                other_date = date_object(int(y), int(m), int(d))
-
-                return this_date > other_date
-                
-            return False
-        elif isinstance(other, date_object):
-            if is_ymd_date(other):
-                (y, m, d) = self._ymd_from_date(other) # strings
-                other_date = date_object(int(y), int(m), int(d))
-                return this_date > other_date
-            
-            return False
-        else:
-            return False
+        other_date = self._coerce_to_date(other)
+        if other_date is None:
+            return NotImplemented
+        return self._date == other_date
     
-    def __ge__(self, other) -> bool:
-        # Calculate this objects date representation
-        this_date = date_object(int(self._year), int(self._month), int(self._day))
-
-        # Compare all supported instances
-        if isinstance(other, self.__class__):
-            other_date = date_object(int(other._year), int(other._month), int(other._day))
-            return this_date >= other_date
-        
-        elif isinstance(other, str):
-            if is_ymd(other):
-                y, m, d = self._ymd_from_string(other)
-                other_date = date_object(int(y), int(m), int(d))
-                
-                return this_date >= other_date
-            return False
-        
-        elif isinstance(other, dt):
-            if is_ymd_datetime(other):
-                (y, m, d) = self._ymd_from_datetime(other) # strings
-                other_date = date_object(int(y), int(m), int(d))
-
-                return this_date >= other_date
-                
-            return False
-        elif isinstance(other, date_object):
-            if is_ymd_date(other):
-                (y, m, d) = self._ymd_from_date(other) # strings
-                other_date = date_object(int(y), int(m), int(d))
-                return this_date >= other_date
-            
-            return False
-        else:
-            return False
+    def __lt__(self, other) -> bool:
+        # __gt__, __le__ and __ge__ are filled in by total_ordering
+        other_date = self._coerce_to_date(other)
+        if other_date is None:
+            return NotImplemented
+        return self._date < other_date
+    
+    def __hash__(self) -> int:
+        # Hashes like the equivalent date, consistent with __eq__
+        return hash(self._date)
 
     def __str__(self):
         """
         Use str(YMDDate) to easily obtain the YYYY-MM-DD string representation.
         """
-        return f"{self._year}-{self._month}-{self._day}"
+        return self._str
+    
+    def __repr__(self):
+        return f"YMDDate('{self._str}')"
+    
+    @staticmethod
+    def _coerce_to_date(other):
+        """
+        !!!INTERNAL METHOD!!!
+        This method should only be used internally by the YMDDate class. Outside use
+        is not suggested and may result in broken code and unexpected behavior.
+
+        Description:
+        ------------
+        Converts a YMDDate, date, datetime, or YYYY-MM-DD string to a datetime.date object.
+        Returns None for invalid strings and unsupported types, which the comparison
+        operators turn into NotImplemented.
+        """
+        # YMDDate is not a date subclass, so isinstance is safe and admits subclasses
+        if isinstance(other, YMDDate):
+            return other._date
+        # Exact type checks here; dt is a subclass of date_object
+        other_type = type(other)
+        if other_type is date_object:
+            return other
+        if other_type is dt:
+            return other.date()
+        if other_type is str:
+            return _parse_ymd(other)
+        return None
     
     def _ymd_from_string(self, ymd_string: str):
         """
@@ -523,8 +594,7 @@ class YMDDate:
         Converts a verified string-representation of a YYYY-MM-DD date to a 3-tuple of year, month, date
         string values. Returns as a 3-tuple.
         """
-        year, month, day = ymd_string.split("-")
-        return (str(year), str(month), str(day))
+        return (ymd_string[0:4], ymd_string[5:7], ymd_string[8:10])
     
     def _ymd_from_date(self, ymd_date: date_object):
         """
@@ -537,9 +607,8 @@ class YMDDate:
         Converts a verified date-representation of a YYYY-MM-DD date to a 3-tuple of year, month, date
         string values. Returns as a 3-tuple.
         """
-        # Convert date object to string and wrap _ymd_from_string method
-        ymd_str = str(ymd_date)
-        return self._ymd_from_string(ymd_str)
+        # Format the fields directly; always zero-padded
+        return (f"{ymd_date.year:04d}", f"{ymd_date.month:02d}", f"{ymd_date.day:02d}")
 
     def _ymd_from_datetime(self, ymd_datetime: dt):
         """
@@ -552,8 +621,5 @@ class YMDDate:
         Converts a verified datetime-representation of a YYYY-MM-DD date to a 3-tuple of year, month, date
         string values. Returns as a 3-tuple.
         """
-        # Convert datetime object to string and extract YYYY-MM-DD representation.
-        ymd_str = str(ymd_datetime).split(" ")[0]
-        return self._ymd_from_string(ymd_str)
-
-
+        # Time fields are ignored; only the date portion is formatted
+        return (f"{ymd_datetime.year:04d}", f"{ymd_datetime.month:02d}", f"{ymd_datetime.day:02d}")